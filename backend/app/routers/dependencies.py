@@ -0,0 +1,22 @@
+"""Shared FastAPI dependencies for API routers."""
+
+from app.services.claude_service import ClaudeService
+from app.services.subprocess_service import SubprocessService
+from app.main import settings
+
+
+def get_claude_service() -> ClaudeService:
+    """Dependency to get Claude service instance."""
+    return ClaudeService(
+        api_key=settings.anthropic_api_key,
+        model=settings.claude_model,
+        max_tokens=settings.claude_max_tokens,
+        temperature=settings.claude_temperature
+    )
+
+
+def get_subprocess_service() -> SubprocessService:
+    """Dependency to get subprocess service instance."""
+    return SubprocessService(
+        pydantic_library_path=settings.pydantic_library_path
+    )
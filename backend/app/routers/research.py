@@ -11,11 +11,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from app.models.schemas import (
     BusinessOutcomeRequest,
-    EntityMapping,
+    ENTITY_MAPPING_LIST_ADAPTER,
     OntologyResearchResponse,
     ErrorResponse
 )
 from app.services.claude_service import ClaudeService
+from app.utils.sse import sse_event
+from app.routers.dependencies import get_claude_service
 from app.main import settings
 
 logger = logging.getLogger(__name__)
@@ -23,16 +25,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_claude_service() -> ClaudeService:
-    """Dependency to get Claude service instance."""
-    return ClaudeService(
-        api_key=settings.anthropic_api_key,
-        model=settings.claude_model,
-        max_tokens=settings.claude_max_tokens,
-        temperature=settings.claude_temperature
-    )
-
-
 @router.post("/research")
 async def research_ontologies(
     request: BusinessOutcomeRequest,
@@ -75,11 +67,11 @@ async def research_ontologies(
             ):
                 reasoning_chunks.append(chunk)
                 # Send chunk as SSE
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                yield sse_event({'type': 'chunk', 'content': chunk})
 
             # Parse the complete response to extract entities
             full_response = "".join(reasoning_chunks)
-            logger.debug(f"Full Claude response: {full_response}")
+            logger.debug("Full Claude response: %s", full_response)
 
             # Extract JSON from response (Claude may wrap it in markdown)
             try:
@@ -89,7 +81,7 @@ async def research_ontologies(
                 if json_start >= 0 and json_end > json_start:
                     json_str = full_response[json_start:json_end]
                     result = json.loads(json_str)
-                    entities = [EntityMapping(**e) for e in result.get("entities", [])]
+                    entities = ENTITY_MAPPING_LIST_ADAPTER.validate_python(result.get("entities", []))
                 else:
                     logger.error("No JSON found in Claude response")
                     entities = []
@@ -104,7 +96,7 @@ async def research_ontologies(
                 total_entities=len(entities)
             )
 
-            yield f"data: {json.dumps({'type': 'complete', 'result': final_result.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'complete', 'result': final_result})
 
         except Exception as e:
             logger.error(f"Error in ontology research: {e}", exc_info=True)
@@ -112,7 +104,7 @@ async def research_ontologies(
                 error="Ontology research failed",
                 detail=str(e)
             )
-            yield f"data: {json.dumps({'type': 'error', 'error': error_response.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'error', 'error': error_response})
 
     return StreamingResponse(
         event_generator(),
@@ -14,7 +14,7 @@ import importlib
 import inspect
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Type
+from typing import Dict, Any, List, Tuple, Type
 from enum import Enum
 from datetime import date, datetime
 from decimal import Decimal
@@ -22,6 +22,9 @@ from pydantic import BaseModel, RootModel
 
 logger = logging.getLogger(__name__)
 
+# Shared base classes emitted by gen-pydantic that never get their own tests
+_BASE_MODEL_NAMES = frozenset({'ConfiguredBaseModel', 'ProvenanceFields', 'EdgeProvenanceFields'})
+
 
 class TestGenerator:
     """Generates pytest test files from Pydantic models."""
@@ -34,7 +37,6 @@ class TestGenerator:
         """
         self.pydantic_library_path = Path(pydantic_library_path)
         self.tests_dir = self.pydantic_library_path / "tests"
-        self.tests_dir.mkdir(parents=True, exist_ok=True)
 
         # Add pydantic_library to Python path so we can import generated models
         pydantic_lib_abs = str(self.pydantic_library_path.resolve())
@@ -79,7 +81,7 @@ class TestGenerator:
             for name, obj in inspect.getmembers(models_module):
                 if inspect.isclass(obj) and issubclass(obj, BaseModel) and obj != BaseModel:
                     # Skip base classes
-                    if name in ['ConfiguredBaseModel', 'ProvenanceFields', 'EdgeProvenanceFields']:
+                    if name in _BASE_MODEL_NAMES:
                         continue
                     model_classes.append((name, obj))
                 elif inspect.isclass(obj) and issubclass(obj, Enum) and obj != Enum:
@@ -95,6 +97,7 @@ class TestGenerator:
             )
 
             # Write test file
+            self.tests_dir.mkdir(parents=True, exist_ok=True)
             test_file = self.tests_dir / f"test_{normalized_overlay_name}.py"
             with open(test_file, "w", encoding="utf-8") as f:
                 f.write(test_code)
@@ -222,18 +225,7 @@ from generated.pydantic.overlays.{overlay_name}_models import (
 
     def _generate_single_entity_test(self, class_name: str, cls: Type[BaseModel]) -> str:
         """Generate a single entity creation test."""
-        # Get required fields
-        fields = cls.model_fields
-        required_fields = {
-            name: field for name, field in fields.items()
-            if field.is_required()
-        }
-
-        # Generate sample values
-        field_values = []
-        for field_name, field_info in required_fields.items():
-            value = self._generate_sample_value(field_name, field_info)
-            field_values.append(f"            {field_name}={value}")
+        required_fields, field_values = self._required_field_values(cls)
 
         # Add node_id if not in required fields
         if 'node_id' not in required_fields:
@@ -250,6 +242,25 @@ from generated.pydantic.overlays.{overlay_name}_models import (
         # Basic assertion
         assert instance.node_id is not None'''
 
+    def _required_field_values(self, cls: Type[BaseModel]) -> Tuple[Dict[str, Any], List[str]]:
+        """Collect a model's required fields and their sample kwarg lines.
+
+        Returns:
+            Tuple of (required field name -> FieldInfo, list of
+            ``name=value`` lines indented for a constructor call)
+        """
+        required_fields = {
+            name: field for name, field in cls.model_fields.items()
+            if field.is_required()
+        }
+
+        field_values = []
+        for field_name, field_info in required_fields.items():
+            value = self._generate_sample_value(field_name, field_info)
+            field_values.append(f"            {field_name}={value}")
+
+        return required_fields, field_values
+
     def _generate_sample_value(self, field_name: str, field_info) -> str:
         """Generate a sample value for a field based on its type."""
         # Check type annotation first
@@ -386,8 +397,7 @@ from generated.pydantic.overlays.{overlay_name}_models import (
                 # Missing required fields
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) > 0'''
+        assert exc_info.value.error_count() > 0'''
 
     def _generate_provenance_tests(self, model_classes: List[tuple]) -> str:
         """Generate provenance field tests."""
@@ -396,18 +406,7 @@ from generated.pydantic.overlays.{overlay_name}_models import (
 
         tests = []
         for class_name, cls in model_classes[:2]:  # Test first 2 models
-            # Get all required fields
-            fields = cls.model_fields
-            required_fields = {
-                name: field for name, field in fields.items()
-                if field.is_required()
-            }
-
-            # Generate sample values for required fields
-            field_values = []
-            for field_name, field_info in required_fields.items():
-                value = self._generate_sample_value(field_name, field_info)
-                field_values.append(f"            {field_name}={value}")
+            required_fields, field_values = self._required_field_values(cls)
 
             # Add provenance fields
             if 'node_id' not in required_fields:
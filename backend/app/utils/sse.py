@@ -0,0 +1,14 @@
+"""Server-Sent Events helpers."""
+
+from typing import Any, Dict
+
+from pydantic_core import to_json
+
+
+def sse_event(payload: Dict[str, Any]) -> str:
+    """Encode a payload as one SSE ``data:`` message.
+
+    Every event in a stream goes through here so all messages share one JSON
+    encoder.
+    """
+    return f"data: {to_json(payload).decode()}\n\n"
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ============================================================================
@@ -83,6 +83,10 @@ class EntityMapping(BaseModel):
     reasoning: str = Field(..., description="Why this mapping was chosen")
 
 
+# Built once at import; validates a whole list of entity dicts in one call
+ENTITY_MAPPING_LIST_ADAPTER = TypeAdapter(List[EntityMapping])
+
+
 class OntologyResearchResponse(BaseModel):
     """Response model for ontology research (Step 2)."""
     entities: List[EntityMapping] = Field(..., description="Identified entities with ontology mappings")
@@ -7,8 +7,8 @@ Provides endpoints for:
 """
 # Updated 10:14
 
+import asyncio
 import logging
-import json
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from app.models.schemas import (
@@ -18,11 +18,14 @@ from app.models.schemas import (
     LinkMLSchemaResponse,
     PydanticGenerationRequest,
     PydanticGenerationResponse,
-    ErrorResponse
+    ErrorResponse,
+    ENTITY_MAPPING_LIST_ADAPTER
 )
 from app.services.claude_service import ClaudeService
 from app.services.subprocess_service import SubprocessService
 from app.services.test_generator import TestGenerator
+from app.utils.sse import sse_event
+from app.routers.dependencies import get_claude_service, get_subprocess_service
 from app.main import settings
 
 logger = logging.getLogger(__name__)
@@ -30,23 +33,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_claude_service() -> ClaudeService:
-    """Dependency to get Claude service instance."""
-    return ClaudeService(
-        api_key=settings.anthropic_api_key,
-        model=settings.claude_model,
-        max_tokens=settings.claude_max_tokens,
-        temperature=settings.claude_temperature
-    )
-
-
-def get_subprocess_service() -> SubprocessService:
-    """Dependency to get subprocess service instance."""
-    return SubprocessService(
-        pydantic_library_path=settings.pydantic_library_path
-    )
-
-
 @router.post("/generate-outcome-spec")
 async def generate_outcome_spec(
     request: OutcomeSpecRequest,
@@ -75,8 +61,7 @@ async def generate_outcome_spec(
         """Generate SSE events from Claude stream."""
         try:
             # Convert entities dict to EntityMapping objects
-            from app.models.schemas import EntityMapping
-            entities = [EntityMapping(**e) for e in request.entities]
+            entities = ENTITY_MAPPING_LIST_ADAPTER.validate_python(request.entities)
 
             # Stream Claude's generation
             response_chunks = []
@@ -86,7 +71,7 @@ async def generate_outcome_spec(
                 custom_prompt=request.custom_prompt
             ):
                 response_chunks.append(chunk)
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                yield sse_event({'type': 'chunk', 'content': chunk})
 
             # Extract YAML from response
             full_response = "".join(response_chunks)
@@ -104,7 +89,7 @@ async def generate_outcome_spec(
                 yaml_content=yaml_content
             )
 
-            yield f"data: {json.dumps({'type': 'complete', 'result': final_result.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'complete', 'result': final_result})
 
         except Exception as e:
             logger.error(f"Error generating OutcomeSpec: {e}", exc_info=True)
@@ -112,7 +97,7 @@ async def generate_outcome_spec(
                 error="OutcomeSpec generation failed",
                 detail=str(e)
             )
-            yield f"data: {json.dumps({'type': 'error', 'error': error_response.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'error', 'error': error_response})
 
     return StreamingResponse(
         event_generator(),
@@ -154,8 +139,7 @@ async def generate_linkml_schema(
     async def event_generator():
         """Generate SSE events from Claude stream."""
         try:
-            from app.models.schemas import EntityMapping
-            entities = [EntityMapping(**e) for e in request.entities]
+            entities = ENTITY_MAPPING_LIST_ADAPTER.validate_python(request.entities)
 
             # Stream Claude's generation
             response_chunks = []
@@ -165,7 +149,7 @@ async def generate_linkml_schema(
                 custom_prompt=request.custom_prompt
             ):
                 response_chunks.append(chunk)
-                yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                yield sse_event({'type': 'chunk', 'content': chunk})
 
             # Extract YAML from response
             full_response = "".join(response_chunks)
@@ -206,14 +190,14 @@ async def generate_linkml_schema(
                         if is_valid_after_repair:
                             logger.info("✅ Schema is now valid after auto-repair")
                             yaml_content = repaired_yaml  # Use repaired schema
-                            yield f"data: {json.dumps({'type': 'info', 'content': f'Auto-repaired schema: {len(repairs_made)} fixes applied'})}\n\n"
+                            yield sse_event({'type': 'info', 'content': f'Auto-repaired schema: {len(repairs_made)} fixes applied'})
                         else:
                             logger.warning(f"⚠️  Schema still has {len(remaining_errors)} errors after auto-repair")
                             yaml_content = repaired_yaml  # Still use repaired schema (partial fix is better than none)
-                            yield f"data: {json.dumps({'type': 'warning', 'content': f'Partial auto-repair: {len(repairs_made)} fixes applied, {len(remaining_errors)} issues remain'})}\n\n"
+                            yield sse_event({'type': 'warning', 'content': f'Partial auto-repair: {len(repairs_made)} fixes applied, {len(remaining_errors)} issues remain'})
                     else:
                         logger.info("ℹ️  No auto-repairable issues found")
-                        yield f"data: {json.dumps({'type': 'warning', 'content': f'Schema validation found {len(validation_errors)} issues. Check logs for details.'})}\n\n"
+                        yield sse_event({'type': 'warning', 'content': f'Schema validation found {len(validation_errors)} issues. Check logs for details.'})
                 else:
                     logger.info("✅ Schema validation passed")
             except Exception as e:
@@ -236,7 +220,7 @@ async def generate_linkml_schema(
                 entity_count=entity_count
             )
 
-            yield f"data: {json.dumps({'type': 'complete', 'result': final_result.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'complete', 'result': final_result})
 
         except Exception as e:
             logger.error(f"Error generating LinkML schema: {e}", exc_info=True)
@@ -244,7 +228,7 @@ async def generate_linkml_schema(
                 error="LinkML schema generation failed",
                 detail=str(e)
             )
-            yield f"data: {json.dumps({'type': 'error', 'error': error_response.model_dump(mode='json')})}\n\n"
+            yield sse_event({'type': 'error', 'error': error_response})
 
     return StreamingResponse(
         event_generator(),
@@ -333,7 +317,10 @@ async def generate_pydantic_models(
         except Exception as e:
             logger.error(f"❌ Validation/repair failed: {e}", exc_info=True)
 
-        result = subprocess_service.generate_pydantic_models(
+        # gen-pydantic and the test generator block on subprocess/file I/O;
+        # run them in a worker thread so concurrent SSE streams keep flowing
+        result = await asyncio.to_thread(
+            subprocess_service.generate_pydantic_models,
             overlay_name=request.overlay_name,
             linkml_schema_content=linkml_schema
         )
@@ -343,7 +330,9 @@ async def generate_pydantic_models(
             try:
                 logger.info("🧪 Auto-generating test file...")
                 test_generator = TestGenerator(settings.pydantic_library_path)
-                test_result = test_generator.generate_test_file(request.overlay_name)
+                test_result = await asyncio.to_thread(
+                    test_generator.generate_test_file, request.overlay_name
+                )
 
                 if test_result.get('success'):
                     logger.info(f"✅ Auto-generated test file: {test_result['test_file_path']}")
@@ -355,7 +344,7 @@ async def generate_pydantic_models(
                 logger.error(f"❌ Error in test generation: {e}", exc_info=True)
                 # Don't fail the whole request if test generation fails
 
-        return PydanticGenerationResponse(**result)
+        return PydanticGenerationResponse.model_validate(result)
 
     except Exception as e:
         logger.error(f"Error generating Pydantic models: {e}", exc_info=True)
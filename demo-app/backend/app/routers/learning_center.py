@@ -79,12 +79,33 @@ class LogBroadcaster:
 log_broadcaster = LogBroadcaster()
 
 
+# Message markers checked in order; the first match wins
+_STEP_MARKERS = tuple((f"step {n}", n) for n in range(1, 7))
+
+
 class WebSocketLogHandler(logging.Handler):
     """Custom log handler that broadcasts to WebSocket clients."""
 
     def __init__(self, broadcaster: LogBroadcaster):
         super().__init__()
         self.broadcaster = broadcaster
+        # Event loop the broadcaster runs on, recorded on the first emit from
+        # it so records logged in worker threads can be handed back to it
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _schedule_broadcast(self, log_entry: Dict[str, Any]):
+        """Schedule a broadcast on the event loop from any thread."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            self.loop = loop
+            loop.create_task(self.broadcaster.broadcast(log_entry))
+        elif self.loop is not None and not self.loop.is_closed():
+            # Threadpool endpoints and asyncio.to_thread workers have no loop
+            asyncio.run_coroutine_threadsafe(self.broadcaster.broadcast(log_entry), self.loop)
 
     def emit(self, record: logging.LogRecord):
         """Emit log record to WebSocket clients."""
@@ -101,32 +122,25 @@ class WebSocketLogHandler(logging.Handler):
 
             # Try to extract step number from logger name or message
             step_number = None
-            if "step" in record.name.lower():
+            logger_name = record.name.lower()
+            if "step" in logger_name:
                 # Try to extract step number from logger name
-                parts = record.name.lower().split("step")
+                parts = logger_name.split("step")
                 if len(parts) > 1 and parts[1][:1].isdigit():
                     step_number = int(parts[1][:1])
-            elif "step" in record.getMessage().lower():
-                # Try to extract from message
+            else:
+                # Try to extract from message (formatted once, not per check)
                 msg = record.getMessage().lower()
-                if "step 1" in msg:
-                    step_number = 1
-                elif "step 2" in msg:
-                    step_number = 2
-                elif "step 3" in msg:
-                    step_number = 3
-                elif "step 4" in msg:
-                    step_number = 4
-                elif "step 5" in msg:
-                    step_number = 5
-                elif "step 6" in msg:
-                    step_number = 6
+                if "step" in msg:
+                    for marker, number in _STEP_MARKERS:
+                        if marker in msg:
+                            step_number = number
+                            break
 
             if step_number:
                 log_entry["step"] = step_number
 
-            # Schedule broadcast (must be done in async context)
-            asyncio.create_task(self.broadcaster.broadcast(log_entry))
+            self._schedule_broadcast(log_entry)
 
         except Exception:
             self.handleError(record)
@@ -179,6 +193,18 @@ class StepHelpResponse(BaseModel):
 # FILE SYSTEM ENDPOINTS
 # ============================================================================
 
+# File extension -> syntax highlighting language
+LANGUAGE_MAP = {
+    ".py": "python",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".json": "json",
+    ".md": "markdown",
+    ".txt": "text",
+    ".log": "text"
+}
+
+
 @router.get("/files/browse", response_model=List[FileNode])
 async def browse_files(
     path: str = Query("/", description="Path to browse (relative to pydantic_library)")
@@ -278,16 +304,7 @@ async def read_file(
 
         # Determine language for syntax highlighting
         extension = target_path.suffix.lower()
-        language_map = {
-            ".py": "python",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".json": "json",
-            ".md": "markdown",
-            ".txt": "text",
-            ".log": "text"
-        }
-        language = language_map.get(extension, "text")
+        language = LANGUAGE_MAP.get(extension, "text")
 
         # Read file content
         with open(target_path, "r", encoding="utf-8") as f:
@@ -415,6 +432,12 @@ STEP_HELP_CONTENT = {
     }
 }
 
+# Validated once at import; the help endpoints only look these up
+STEP_HELP_RESPONSES: Dict[int, StepHelpResponse] = {
+    num: StepHelpResponse(step_number=num, **content)
+    for num, content in STEP_HELP_CONTENT.items()
+}
+
 
 @router.get("/help/step/{step_number}", response_model=StepHelpResponse)
 async def get_step_help(step_number: int):
@@ -426,14 +449,10 @@ async def get_step_help(step_number: int):
     Returns:
         StepHelpResponse with step-specific guidance
     """
-    if step_number not in STEP_HELP_CONTENT:
+    if step_number not in STEP_HELP_RESPONSES:
         raise HTTPException(status_code=404, detail=f"No help content for step {step_number}")
 
-    content = STEP_HELP_CONTENT[step_number]
-    return StepHelpResponse(
-        step_number=step_number,
-        **content
-    )
+    return STEP_HELP_RESPONSES[step_number]
 
 
 @router.get("/help/all", response_model=List[StepHelpResponse])
@@ -443,10 +462,7 @@ async def get_all_step_help():
     Returns:
         List of StepHelpResponse objects for steps 1-6
     """
-    return [
-        StepHelpResponse(step_number=num, **content)
-        for num, content in STEP_HELP_CONTENT.items()
-    ]
+    return list(STEP_HELP_RESPONSES.values())
 
 
 @router.get("/health")
@@ -20,6 +20,41 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Static per-step prompt metadata, built once at import
+DEFAULT_PROMPTS: Dict[str, Dict[str, Any]] = {
+    "step2_research": {
+        "step": "Step 2: Ontology Research",
+        "system": ONTOLOGY_RESEARCH_SYSTEM,
+        "task": ONTOLOGY_RESEARCH_TASK,
+        "variables": [
+            {"name": "business_text", "description": "Business outcome description"},
+            {"name": "user_context", "description": "Optional user context or instructions"}
+        ],
+        "description": "Analyzes business text and maps entities to canonical ontologies"
+    },
+    "step3_outcome_spec": {
+        "step": "Step 3: OutcomeSpec Generation",
+        "system": OUTCOME_SPEC_SYSTEM,
+        "task": OUTCOME_SPEC_TASK,
+        "variables": [
+            {"name": "business_text", "description": "Business outcome description"},
+            {"name": "entities", "description": "Identified entities from research"}
+        ],
+        "description": "Generates OutcomeSpec YAML with outcome questions and validation queries"
+    },
+    "step4_linkml": {
+        "step": "Step 4: LinkML Schema Generation",
+        "system": LINKML_SCHEMA_SYSTEM,
+        "task": LINKML_SCHEMA_TASK,
+        "variables": [
+            {"name": "outcome_spec", "description": "Generated OutcomeSpec"},
+            {"name": "entities", "description": "Entity definitions with ontology mappings"}
+        ],
+        "description": "Generates LinkML schema YAML with classes, slots, and relationships"
+    }
+}
+
+
 @router.get("/default-prompts")
 async def get_all_default_prompts() -> Dict[str, Dict[str, Any]]:
     """Get all default prompts for all steps.
@@ -27,38 +62,7 @@ async def get_all_default_prompts() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary with prompts for each step
     """
-    return {
-        "step2_research": {
-            "step": "Step 2: Ontology Research",
-            "system": ONTOLOGY_RESEARCH_SYSTEM,
-            "task": ONTOLOGY_RESEARCH_TASK,
-            "variables": [
-                {"name": "business_text", "description": "Business outcome description"},
-                {"name": "user_context", "description": "Optional user context or instructions"}
-            ],
-            "description": "Analyzes business text and maps entities to canonical ontologies"
-        },
-        "step3_outcome_spec": {
-            "step": "Step 3: OutcomeSpec Generation",
-            "system": OUTCOME_SPEC_SYSTEM,
-            "task": OUTCOME_SPEC_TASK,
-            "variables": [
-                {"name": "business_text", "description": "Business outcome description"},
-                {"name": "entities", "description": "Identified entities from research"}
-            ],
-            "description": "Generates OutcomeSpec YAML with outcome questions and validation queries"
-        },
-        "step4_linkml": {
-            "step": "Step 4: LinkML Schema Generation",
-            "system": LINKML_SCHEMA_SYSTEM,
-            "task": LINKML_SCHEMA_TASK,
-            "variables": [
-                {"name": "outcome_spec", "description": "Generated OutcomeSpec"},
-                {"name": "entities", "description": "Entity definitions with ontology mappings"}
-            ],
-            "description": "Generates LinkML schema YAML with classes, slots, and relationships"
-        }
-    }
+    return DEFAULT_PROMPTS
 
 
 @router.get("/default-prompts/{step_id}")
@@ -71,15 +75,13 @@ async def get_default_prompt(step_id: str) -> Dict[str, Any]:
     Returns:
         Prompt details for the specified step
     """
-    all_prompts = await get_all_default_prompts()
-
-    if step_id not in all_prompts:
+    if step_id not in DEFAULT_PROMPTS:
         return {
             "error": f"Unknown step_id: {step_id}",
-            "available_steps": list(all_prompts.keys())
+            "available_steps": list(DEFAULT_PROMPTS.keys())
         }
 
-    return all_prompts[step_id]
+    return DEFAULT_PROMPTS[step_id]
 
 
 @router.get("/health")
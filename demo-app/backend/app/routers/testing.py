@@ -16,6 +16,7 @@ from app.models.schemas import (
 )
 from app.services.subprocess_service import SubprocessService
 from app.services.test_generator import TestGenerator
+from app.routers.dependencies import get_subprocess_service
 from app.main import settings
 
 logger = logging.getLogger(__name__)
@@ -23,20 +24,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def get_subprocess_service() -> SubprocessService:
-    """Dependency to get subprocess service instance."""
-    return SubprocessService(
-        pydantic_library_path=settings.pydantic_library_path
-    )
-
-
 @router.post("/run-tests", response_model=TestExecutionResponse)
-async def run_tests(
+def run_tests(
     request: TestExecutionRequest,
     subprocess_service: SubprocessService = Depends(get_subprocess_service)
 ):
     """Run pytest on generated models (Step 6).
 
+    Declared sync so FastAPI runs the blocking pytest subprocess in its
+    threadpool instead of on the event loop.
+
     **Flow**:
     1. Auto-generate test file from Pydantic models
     2. Execute pytest subprocess with JSON output
@@ -72,7 +69,7 @@ async def run_tests(
             overlay_name=request.overlay_name
         )
 
-        return TestExecutionResponse(**result)
+        return TestExecutionResponse.model_validate(result)
 
     except Exception as e:
         logger.error(f"Error running tests: {e}", exc_info=True)
@@ -83,7 +80,7 @@ async def run_tests(
 
 
 @router.get("/library-coverage", response_model=LibraryCoverageStats)
-async def get_library_coverage(
+def get_library_coverage(
     subprocess_service: SubprocessService = Depends(get_subprocess_service)
 ):
     """Get pydantic_library coverage statistics.
@@ -104,7 +101,7 @@ async def get_library_coverage(
 
     try:
         result = subprocess_service.get_library_coverage()
-        return LibraryCoverageStats(**result)
+        return LibraryCoverageStats.model_validate(result)
 
     except Exception as e:
         logger.error(f"Error getting library coverage: {e}", exc_info=True)
@@ -10,6 +10,7 @@ NO MOCKS - Real Anthropic API calls with streaming support.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, AsyncGenerator, Optional
 import anthropic
 from app.models.schemas import EntityMapping
@@ -22,6 +23,16 @@ from app.prompts import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _client_for(api_key: str) -> anthropic.Anthropic:
+    """Return a shared Anthropic client per API key.
+
+    ClaudeService is built per request; reusing the client keeps its HTTP
+    connection pool warm instead of paying a fresh TLS handshake each time.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
 class ClaudeService:
     """Service for Claude AI interactions."""
 
@@ -34,7 +45,7 @@ class ClaudeService:
             max_tokens: Maximum tokens for responses
             temperature: Temperature for generation (0.0-1.0)
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = _client_for(api_key)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
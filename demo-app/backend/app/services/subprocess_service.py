@@ -13,14 +13,68 @@ NO MOCKS - Real subprocess calls.
 
 import logging
 import subprocess
-import json
+import tempfile
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Zeroed counts shared by every failed test run result
+_FAILED_TEST_RUN: Dict[str, Any] = {
+    "success": False,
+    "total_tests": 0,
+    "passed": 0,
+    "failed": 0,
+    "skipped": 0,
+    "duration": 0.0,
+}
+
+
+def _failed_test_run(stdout: str, stderr: Optional[str] = None) -> Dict[str, Any]:
+    """Build a run_tests result for a run that produced no test results."""
+    result = dict(
+        _FAILED_TEST_RUN,
+        tests=[],
+        stdout=stdout,
+        timestamp=datetime.utcnow().isoformat()
+    )
+    if stderr is not None:
+        result["stderr"] = stderr
+    return result
+
+
+def _empty_coverage() -> Dict[str, Any]:
+    """Build a get_library_coverage result for a library with no overlays."""
+    return {
+        "total_overlays": 0,
+        "total_entities": 0,
+        "total_edges": 0,
+        "overlays": [],
+        "last_updated": datetime.utcnow().isoformat()
+    }
+
+
+@lru_cache(maxsize=256)
+def _count_overlay_schema(schema_path: str, mtime_ns: int) -> Tuple[int, int]:
+    """Count entities and edges in an overlay schema file.
+
+    Keyed on the file's mtime so unchanged overlays are not re-read on
+    every coverage request.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    # Count entities (classes) and edges (relationships)
+    # Simplified counting - real implementation would parse YAML properly
+    entity_count = content.count("class_uri:")
+    edge_count = content.count("range:")  # Approximation
+    return entity_count, edge_count
+
 
 class SubprocessService:
     """Service for subprocess execution."""
@@ -125,7 +179,10 @@ class SubprocessService:
                     slot_renames[dup_slot_name] = {}
                 slot_renames[dup_slot_name][line_num] = new_name
 
-                logger.info(f"Will rename duplicate slot '{dup_slot_name}' at line {line_num} to '{new_name}'")
+                logger.info(
+                    "Will rename duplicate slot '%s' at line %d to '%s'",
+                    dup_slot_name, line_num, new_name
+                )
 
         # Phase 4: Apply renames to slot definitions
         for slot_name, renames in slot_renames.items():
@@ -162,7 +219,10 @@ class SubprocessService:
 
                             if target_new_name:
                                 lines[i] = line.replace(old_slot_ref, target_new_name)
-                                logger.info(f"Updated slot reference in {current_class}: {old_slot_ref} -> {target_new_name}")
+                                logger.info(
+                                    "Updated slot reference in %s: %s -> %s",
+                                    current_class, old_slot_ref, target_new_name
+                                )
                 elif not line.startswith('      '):
                     in_slots_section = False
 
@@ -276,52 +336,51 @@ class SubprocessService:
 
             if not test_file.exists():
                 logger.warning(f"Test file not found: {test_file}")
-                return {
-                    "success": False,
-                    "total_tests": 0,
-                    "passed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "duration": 0.0,
-                    "tests": [],
-                    "stdout": f"Test file not found: {test_file}",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                return _failed_test_run(f"Test file not found: {test_file}")
 
             # Execute pytest with JSON output and UTF-8 encoding for Windows compatibility
             logger.info(f"Running pytest for {overlay_name}")
             env = os.environ.copy()
             env["PYTHONIOENCODING"] = "utf-8"
             env["PYTHONPATH"] = str(self.pydantic_library_path)
-            result = subprocess.run(
-                [
-                    "pytest",
-                    str(test_file),
-                    "-v",
-                    "--tb=short",
-                    "--json-report",
-                    "--json-report-file=test_report.json"
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-                cwd=str(self.pydantic_library_path),
-                encoding="utf-8",
-                env=env
-            )
+
+            # Each run gets its own report file; run_tests executes on the
+            # threadpool, so concurrent runs must not share one path
+            report_fd, report_path = tempfile.mkstemp(prefix="test_report_", suffix=".json")
+            os.close(report_fd)
+            report_file = Path(report_path)
+            try:
+                result = subprocess.run(
+                    [
+                        "pytest",
+                        str(test_file),
+                        "-v",
+                        "--tb=short",
+                        "--json-report",
+                        f"--json-report-file={report_file}"
+                    ],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    cwd=str(self.pydantic_library_path),
+                    encoding="utf-8",
+                    env=env
+                )
+                report_bytes = report_file.read_bytes()
+            finally:
+                report_file.unlink(missing_ok=True)
 
             # Log pytest execution results
             logger.info(f"Pytest exit code: {result.returncode}")
             if result.stderr:
                 logger.error(f"Pytest stderr: {result.stderr}")
             if result.stdout:
-                logger.info(f"Pytest stdout (first 500 chars): {result.stdout[:500]}")
+                logger.info("Pytest stdout (first 500 chars): %.500s", result.stdout)
 
-            # Parse test results
-            report_file = self.pydantic_library_path / "test_report.json"
-            if report_file.exists():
-                with open(report_file, "r", encoding="utf-8") as f:
-                    report = json.load(f)
+            # Parse test results (mkstemp created the file, so empty means
+            # pytest never wrote a report)
+            if report_bytes:
+                report = orjson.loads(report_bytes)
 
                 tests = []
                 for test in report.get("tests", []):
@@ -347,37 +406,19 @@ class SubprocessService:
                 }
             else:
                 # Fallback: return stderr/stdout for debugging
-                logger.warning(f"JSON report file not found at {report_file}")
+                logger.warning(f"JSON report was not written to {report_file}")
                 logger.warning("This usually means pytest-json-report plugin is not installed or pytest failed to run")
 
                 error_output = result.stderr if result.stderr else result.stdout
 
-                return {
-                    "success": False,
-                    "total_tests": 0,
-                    "passed": 0,
-                    "failed": 0,
-                    "skipped": 0,
-                    "duration": 0.0,
-                    "tests": [],
-                    "stdout": result.stdout,
-                    "stderr": result.stderr or "JSON report file not generated - pytest-json-report may not be installed",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                return _failed_test_run(
+                    result.stdout,
+                    result.stderr or "JSON report file not generated - pytest-json-report may not be installed"
+                )
 
         except Exception as e:
             logger.error(f"Error running tests: {e}", exc_info=True)
-            return {
-                "success": False,
-                "total_tests": 0,
-                "passed": 0,
-                "failed": 0,
-                "skipped": 0,
-                "duration": 0.0,
-                "tests": [],
-                "stdout": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return _failed_test_run(str(e))
 
     def get_library_coverage(self) -> Dict[str, Any]:
         """Get statistics about pydantic_library coverage.
@@ -390,27 +431,16 @@ class SubprocessService:
         try:
             overlays_dir = self.pydantic_library_path / "schemas" / "overlays"
             if not overlays_dir.exists():
-                return {
-                    "total_overlays": 0,
-                    "total_entities": 0,
-                    "total_edges": 0,
-                    "overlays": [],
-                    "last_updated": datetime.utcnow().isoformat()
-                }
+                return _empty_coverage()
 
             overlays = []
             total_entities = 0
             total_edges = 0
 
             for schema_file in overlays_dir.glob("*_overlay.yaml"):
-                # Read and parse YAML (simplified - real implementation would use yaml library)
-                with open(schema_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Count entities (classes) and edges (relationships)
-                # Simplified counting - real implementation would parse YAML properly
-                entity_count = content.count("class_uri:")
-                edge_count = content.count("range:")  # Approximation
+                entity_count, edge_count = _count_overlay_schema(
+                    str(schema_file), schema_file.stat().st_mtime_ns
+                )
 
                 overlay_name = schema_file.stem.replace("_overlay", "")
                 overlays.append({
@@ -433,10 +463,4 @@ class SubprocessService:
 
         except Exception as e:
             logger.error(f"Error getting library coverage: {e}", exc_info=True)
-            return {
-                "total_overlays": 0,
-                "total_entities": 0,
-                "total_edges": 0,
-                "overlays": [],
-                "last_updated": datetime.utcnow().isoformat()
-            }
+            return _empty_coverage()
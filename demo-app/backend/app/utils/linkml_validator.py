@@ -1,8 +1,27 @@
 """LinkML schema validation utilities."""
 
 import yaml
+from functools import lru_cache
 from typing import Set, Dict, List, Tuple
 
+# LinkML/XSD built-in range types (never custom enums)
+BUILTIN_TYPES = frozenset({
+    'string', 'integer', 'float', 'boolean', 'date', 'datetime',
+    'time', 'uri', 'uriorcurie', 'ncname', 'xsd:string',
+    'xsd:integer', 'xsd:float', 'xsd:boolean', 'xsd:date',
+    'xsd:dateTime', 'xsd:time', 'xsd:anyURI'
+})
+
+
+@lru_cache(maxsize=32)
+def _parse_schema(schema_yaml: str) -> Dict:
+    """Parse schema YAML once per distinct string.
+
+    validate_linkml_schema and get_schema_completeness_report run back to back
+    on the same schema. The result is shared, so callers must not mutate it.
+    """
+    return yaml.safe_load(schema_yaml)
+
 
 def validate_linkml_schema(schema_yaml: str) -> Tuple[bool, List[str]]:
     """Validate LinkML schema for completeness.
@@ -18,7 +37,7 @@ def validate_linkml_schema(schema_yaml: str) -> Tuple[bool, List[str]]:
         Tuple of (is_valid, error_messages)
     """
     try:
-        schema = yaml.safe_load(schema_yaml)
+        schema = _parse_schema(schema_yaml)
     except yaml.YAMLError as e:
         return False, [f"Invalid YAML: {str(e)}"]
 
@@ -33,6 +52,9 @@ def validate_linkml_schema(schema_yaml: str) -> Tuple[bool, List[str]]:
     # Get all classes
     classes = schema.get('classes', {})
 
+    # Class names are valid ranges too
+    referenced_classes = set(classes.keys())
+
     # Check each class for undefined slot references
     for class_name, class_def in classes.items():
         # Get slots used by this class
@@ -50,21 +72,13 @@ def validate_linkml_schema(schema_yaml: str) -> Tuple[bool, List[str]]:
         slot_range = slot_def.get('range')
 
         if slot_range:
-            # Check if range is a custom enum (not a built-in type)
-            builtin_types = {
-                'string', 'integer', 'float', 'boolean', 'date', 'datetime',
-                'time', 'uri', 'uriorcurie', 'ncname', 'xsd:string',
-                'xsd:integer', 'xsd:float', 'xsd:boolean', 'xsd:date',
-                'xsd:dateTime', 'xsd:time', 'xsd:anyURI'
-            }
-
-            # Also check if it's a reference to another class
-            referenced_classes = set(classes.keys())
-
-            if (slot_range not in builtin_types and
-                slot_range not in referenced_classes and
-                slot_range.endswith('Enum') and
-                slot_range not in defined_enums):
+            # Check if range is a custom enum (not a built-in type or class).
+            # Most ranges are builtins or classes; the suffix check rejects
+            # them before any set lookups
+            if (slot_range.endswith('Enum') and
+                slot_range not in defined_enums and
+                slot_range not in BUILTIN_TYPES and
+                slot_range not in referenced_classes):
                 errors.append(
                     f"Slot '{slot_name}' has range '{slot_range}' but this enum is not defined. "
                     f"Add '{slot_range}' to the 'enums:' section."
@@ -85,7 +99,7 @@ def get_schema_completeness_report(schema_yaml: str) -> Dict:
         Dictionary with completeness statistics
     """
     try:
-        schema = yaml.safe_load(schema_yaml)
+        schema = _parse_schema(schema_yaml)
     except yaml.YAMLError:
         return {"error": "Invalid YAML"}
 
@@ -130,6 +144,7 @@ def auto_repair_schema(schema_yaml: str) -> Tuple[str, List[str]]:
     Returns:
         Tuple of (repaired_yaml, list_of_repairs_made)
     """
+    # Parsed fresh (not via _parse_schema) because the repair mutates it
     try:
         schema = yaml.safe_load(schema_yaml)
     except yaml.YAMLError as e:
@@ -153,14 +153,20 @@ from .{name}_overlay import (
     # ("SourceEntity", "TargetEntity"): ["EdgeType"],
 }}
 
+# Frozen per-pair edge sets so validate_edge_type is an O(1) membership check.
+# Built once at import; {name.upper()}_EDGE_TYPE_MAP is treated as read-only.
+_ALLOWED_EDGE_SETS: Dict[tuple, frozenset] = {{
+    pair: frozenset(edges) for pair, edges in {name.upper()}_EDGE_TYPE_MAP.items()
+}}
+_NO_EDGES: frozenset = frozenset()
+
 # ==================================================================
 # VALIDATION HELPERS
 # ==================================================================
 
 def validate_edge_type(source_type: str, target_type: str, edge_type: str) -> bool:
     """Validate if an edge type is allowed between two entity types."""
-    allowed_edges = {name.upper()}_EDGE_TYPE_MAP.get((source_type, target_type), [])
-    return edge_type in allowed_edges
+    return edge_type in _ALLOWED_EDGE_SETS.get((source_type, target_type), _NO_EDGES)
 
 
 def get_allowed_edges(source_type: str, target_type: str) -> List[str]:
@@ -101,6 +101,13 @@ AAOIFI_EDGE_TYPE_MAP: Dict[tuple, List[str]] = {
     ("Document", "Agent"): ["AttributedTo"],
 }
 
+# Frozen per-pair edge sets so validate_edge_type is an O(1) membership check.
+# Built once at import; AAOIFI_EDGE_TYPE_MAP is treated as read-only.
+_ALLOWED_EDGE_SETS: Dict[tuple, frozenset] = {
+    pair: frozenset(edges) for pair, edges in AAOIFI_EDGE_TYPE_MAP.items()
+}
+_NO_EDGES: frozenset = frozenset()
+
 # ==================================================================
 # VALIDATION HELPERS
 # ==================================================================
@@ -116,8 +123,7 @@ def validate_edge_type(source_type: str, target_type: str, edge_type: str) -> bo
     Returns:
         bool: True if edge type is valid for this entity pair
     """
-    allowed_edges = AAOIFI_EDGE_TYPE_MAP.get((source_type, target_type), [])
-    return edge_type in allowed_edges
+    return edge_type in _ALLOWED_EDGE_SETS.get((source_type, target_type), _NO_EDGES)
 
 
 def get_allowed_edges(source_type: str, target_type: str) -> List[str]:
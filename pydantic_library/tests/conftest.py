@@ -2,7 +2,9 @@
 import sys
 from pathlib import Path
 
-# Add pydantic_library root to sys.path for imports
+# Add pydantic_library root to sys.path for imports (guarded so repeated
+# or xdist worker imports don't insert it again)
 tests_dir = Path(__file__).parent
-pydantic_lib_root = tests_dir.parent
-sys.path.insert(0, str(pydantic_lib_root))
+pydantic_lib_root = str(tests_dir.parent)
+if pydantic_lib_root not in sys.path:
+    sys.path.insert(0, pydantic_lib_root)
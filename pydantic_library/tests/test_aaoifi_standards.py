@@ -7,7 +7,6 @@ and OutcomeSpec validation queries.
 
 import pytest
 from datetime import date
-from pydantic import ValidationError
 
 # Import AAOIFI models
 from generated.pydantic.overlays.aaoifi_standards_models import (
@@ -26,11 +25,8 @@ from generated.pydantic.overlays.aaoifi_standards_models import (
 
 # Import glue utilities
 from generated.pydantic.overlays.aaoifi_standards_glue import (
-    AAOIFI_NODE_URI,
-    AAOIFI_EDGE_URI,
     AAOIFI_ENTITY_TYPES,
     AAOIFI_EDGE_TYPES,
-    AAOIFI_EDGE_TYPE_MAP,
     validate_edge_type,
     get_allowed_edges,
     get_entity_uri,
@@ -174,22 +170,28 @@ class TestAAOIFIEdgeCreation:
 class TestCanonicalURIMappings:
     """Test canonical ontology URI mappings."""
 
-    def test_entity_uris(self):
+    @pytest.mark.parametrize("entity_type,expected_uri", [
+        ("Document", "http://purl.org/spar/fabio/SpecificationDocument"),
+        ("Section", "http://purl.org/spar/doco/Section"),
+        ("Paragraph", "http://purl.org/spar/doco/Paragraph"),
+        ("Concept", "http://www.w3.org/2004/02/skos/core#Concept"),
+        ("ContractType", "https://spec.edmcouncil.org/fibo/ontology/FND/Agreements/Contracts/Contract"),
+        ("Rule", "https://spec.edmcouncil.org/fibo/ontology/FND/Agreements/Contracts/ContractualElement"),
+        ("Agent", "http://www.w3.org/ns/prov#Agent"),
+    ])
+    def test_entity_uris(self, entity_type, expected_uri):
         """Test all entity types have canonical URIs."""
-        assert get_entity_uri("Document") == "http://purl.org/spar/fabio/SpecificationDocument"
-        assert get_entity_uri("Section") == "http://purl.org/spar/doco/Section"
-        assert get_entity_uri("Paragraph") == "http://purl.org/spar/doco/Paragraph"
-        assert get_entity_uri("Concept") == "http://www.w3.org/2004/02/skos/core#Concept"
-        assert get_entity_uri("ContractType") == "https://spec.edmcouncil.org/fibo/ontology/FND/Agreements/Contracts/Contract"
-        assert get_entity_uri("Rule") == "https://spec.edmcouncil.org/fibo/ontology/FND/Agreements/Contracts/ContractualElement"
-        assert get_entity_uri("Agent") == "http://www.w3.org/ns/prov#Agent"
-
-    def test_edge_uris(self):
+        assert get_entity_uri(entity_type) == expected_uri
+
+    @pytest.mark.parametrize("edge_type,expected_uri", [
+        ("HasComponent", "http://purl.org/dc/terms/hasPart"),
+        ("About", "http://purl.org/dc/terms/subject"),
+        ("EvidenceOf", "http://www.w3.org/ns/prov#wasDerivedFrom"),
+        ("AttributedTo", "http://www.w3.org/ns/prov#wasAttributedTo"),
+    ])
+    def test_edge_uris(self, edge_type, expected_uri):
         """Test all edge types have canonical URIs."""
-        assert get_edge_uri("HasComponent") == "http://purl.org/dc/terms/hasPart"
-        assert get_edge_uri("About") == "http://purl.org/dc/terms/subject"
-        assert get_edge_uri("EvidenceOf") == "http://www.w3.org/ns/prov#wasDerivedFrom"
-        assert get_edge_uri("AttributedTo") == "http://www.w3.org/ns/prov#wasAttributedTo"
+        assert get_edge_uri(edge_type) == expected_uri
 
     def test_uri_prefixes(self):
         """Test URIs use expected ontology prefixes."""
@@ -207,69 +209,81 @@ class TestGraphitiTypeRegistries:
     """Test Graphiti type registry dictionaries."""
 
     def test_entity_type_registry(self):
-        """Test all entity types are registered."""
-        assert "Document" in AAOIFI_ENTITY_TYPES
-        assert "Section" in AAOIFI_ENTITY_TYPES
-        assert "Paragraph" in AAOIFI_ENTITY_TYPES
-        assert "Concept" in AAOIFI_ENTITY_TYPES
-        assert "ContractType" in AAOIFI_ENTITY_TYPES
-        assert "Rule" in AAOIFI_ENTITY_TYPES
-        assert "Agent" in AAOIFI_ENTITY_TYPES
-
-        assert len(AAOIFI_ENTITY_TYPES) == 7
+        """Test exactly the expected entity types are registered."""
+        assert set(AAOIFI_ENTITY_TYPES) == {
+            "Document",
+            "Section",
+            "Paragraph",
+            "Concept",
+            "ContractType",
+            "Rule",
+            "Agent",
+        }
 
     def test_edge_type_registry(self):
-        """Test all edge types are registered."""
-        assert "HasComponent" in AAOIFI_EDGE_TYPES
-        assert "About" in AAOIFI_EDGE_TYPES
-        assert "EvidenceOf" in AAOIFI_EDGE_TYPES
-        assert "AttributedTo" in AAOIFI_EDGE_TYPES
-
-        assert len(AAOIFI_EDGE_TYPES) == 4
-
-    def test_entity_classes_are_correct(self):
+        """Test exactly the expected edge types are registered."""
+        assert set(AAOIFI_EDGE_TYPES) == {
+            "HasComponent",
+            "About",
+            "EvidenceOf",
+            "AttributedTo",
+        }
+
+    @pytest.mark.parametrize("entity_type,model_cls", [
+        ("Document", Document),
+        ("Section", Section),
+        ("Paragraph", Paragraph),
+        ("Concept", Concept),
+        ("ContractType", ContractType),
+        ("Rule", Rule),
+        ("Agent", Agent),
+    ])
+    def test_entity_classes_are_correct(self, entity_type, model_cls):
         """Test entity registry maps to correct Pydantic classes."""
-        assert AAOIFI_ENTITY_TYPES["Document"] == Document
-        assert AAOIFI_ENTITY_TYPES["Section"] == Section
-        assert AAOIFI_ENTITY_TYPES["Paragraph"] == Paragraph
+        assert AAOIFI_ENTITY_TYPES[entity_type] is model_cls
+
+    @pytest.mark.parametrize("edge_type,model_cls", [
+        ("HasComponent", HasComponent),
+        ("About", About),
+        ("EvidenceOf", EvidenceOf),
+        ("AttributedTo", AttributedTo),
+    ])
+    def test_edge_classes_are_correct(self, edge_type, model_cls):
+        """Test edge registry maps to correct Pydantic classes."""
+        assert AAOIFI_EDGE_TYPES[edge_type] is model_cls
 
 
 class TestEdgeTypeValidation:
     """Test edge type validation functions."""
 
-    def test_document_section_component(self):
-        """Test Document → Section HasComponent relationship."""
-        assert validate_edge_type("Document", "Section", "HasComponent") == True
-        assert get_allowed_edges("Document", "Section") == ["HasComponent"]
-
-    def test_section_paragraph_component(self):
-        """Test Section → Paragraph HasComponent relationship."""
-        assert validate_edge_type("Section", "Paragraph", "HasComponent") == True
-
-    def test_paragraph_concept_about(self):
-        """Test Paragraph → Concept About relationship."""
-        assert validate_edge_type("Paragraph", "Concept", "About") == True
-
-    def test_rule_paragraph_evidence(self):
-        """Test Rule → Paragraph EvidenceOf relationship."""
-        assert validate_edge_type("Rule", "Paragraph", "EvidenceOf") == True
-
-    def test_document_agent_attribution(self):
-        """Test Document → Agent AttributedTo relationship."""
-        assert validate_edge_type("Document", "Agent", "AttributedTo") == True
-
-    def test_invalid_edge_type(self):
-        """Test validation rejects invalid edge types."""
-        assert validate_edge_type("Document", "Paragraph", "HasComponent") == False
-        assert validate_edge_type("Section", "Agent", "About") == False
-
-    def test_get_allowed_edges_empty(self):
-        """Test get_allowed_edges returns empty list for invalid pairs."""
-        assert get_allowed_edges("Section", "Agent") == []
+    @pytest.mark.parametrize("source_type,target_type,edge_type,expected", [
+        ("Document", "Section", "HasComponent", True),
+        ("Section", "Paragraph", "HasComponent", True),
+        ("Paragraph", "Concept", "About", True),
+        ("Rule", "Paragraph", "EvidenceOf", True),
+        ("Document", "Agent", "AttributedTo", True),
+        ("Document", "Paragraph", "HasComponent", False),
+        ("Section", "Agent", "About", False),
+    ])
+    def test_validate_edge_type(self, source_type, target_type, edge_type, expected):
+        """Test validation accepts allowed edges and rejects invalid ones."""
+        assert validate_edge_type(source_type, target_type, edge_type) is expected
+
+    @pytest.mark.parametrize("source_type,target_type,expected", [
+        ("Document", "Section", ["HasComponent"]),
+        ("Section", "Agent", []),
+    ])
+    def test_get_allowed_edges(self, source_type, target_type, expected):
+        """Test get_allowed_edges returns allowed edges, or empty list for invalid pairs."""
+        assert get_allowed_edges(source_type, target_type) == expected
 
 
 class TestOutcomeSpecValidation:
-    """Test that generated models support OutcomeSpec validation queries."""
+    """Test that generated models support OutcomeSpec validation queries.
+
+    These only check field presence; validation is covered by the creation
+    tests above, so instances are built with model_construct.
+    """
 
     def test_document_retrieval_fields(self):
         """Validation query: test_document_retrieval
@@ -277,17 +291,17 @@ class TestOutcomeSpecValidation:
         Expected fields: id, title, edition, issued
         Expected relations: AttributedTo
         """
-        doc = Document(
+        doc = Document.model_construct(
             title="Test Standard",
             edition="2023",
             issued=date(2023, 1, 1),
             node_id="TEST-DOC"
         )
-        agent = Agent(
+        agent = Agent.model_construct(
             name="Test Issuer",
             node_id="TEST-AGENT"
         )
-        attribution = AttributedTo(
+        attribution = AttributedTo.model_construct(
             role="issuer",
             rel_id="TEST-ATTR"
         )
@@ -304,9 +318,9 @@ class TestOutcomeSpecValidation:
 
         Expected relations: HasComponent (Document→Section→Paragraph)
         """
-        doc = Document(title="Test", node_id="DOC")
-        section = Section(label="Intro", order=1, node_id="SEC")
-        para = Paragraph(section_id="SEC", ordinal=1, text="Text", node_id="PARA")
+        doc = Document.model_construct(title="Test", node_id="DOC")
+        section = Section.model_construct(label="Intro", order=1, node_id="SEC")
+        para = Paragraph.model_construct(section_id="SEC", ordinal=1, text="Text", node_id="PARA")
 
         # Verify structural fields exist
         assert hasattr(section, 'label')
@@ -319,9 +333,8 @@ class TestOutcomeSpecValidation:
 
         Expected relations: About (Paragraph→Concept)
         """
-        para = Paragraph(section_id="SEC", ordinal=1, text="Test", node_id="PARA")
-        concept = Concept(curie="if:Test", pref_label="Test Concept", node_id="CONCEPT")
-        about_edge = About(rel_id="PARA-CONCEPT")
+        concept = Concept.model_construct(curie="if:Test", pref_label="Test Concept", node_id="CONCEPT")
+        about_edge = About.model_construct(rel_id="PARA-CONCEPT")
 
         assert hasattr(concept, 'pref_label')
 
@@ -331,14 +344,14 @@ class TestOutcomeSpecValidation:
         Expected fields: article_no, normative_effect, page_from, page_to
         Expected relations: EvidenceOf (Rule→Paragraph)
         """
-        rule = Rule(
+        rule = Rule.model_construct(
             title="Test Rule",
             article_no="Art. 1",
             normative_effect="requires",
             text="Test text",
             node_id="RULE"
         )
-        para = Paragraph(
+        para = Paragraph.model_construct(
             section_id="SEC",
             ordinal=1,
             text="Source text",
@@ -346,7 +359,7 @@ class TestOutcomeSpecValidation:
             page_to=11,
             node_id="PARA"
         )
-        evidence = EvidenceOf(
+        evidence = EvidenceOf.model_construct(
             quote="Source text",
             page_from=10,
             page_to=11,
@@ -365,13 +378,12 @@ class TestOutcomeSpecValidation:
 
         Expected relations: About (Paragraph→ContractType), EvidenceOf (Rule→Paragraph)
         """
-        para = Paragraph(section_id="SEC", ordinal=1, text="Contract text", node_id="PARA")
-        contract = ContractType(
+        contract = ContractType.model_construct(
             curie="if:TestContract",
             pref_label="Test Contract",
             node_id="CONTRACT"
         )
-        rule = Rule(
+        rule = Rule.model_construct(
             title="Contract Rule",
             normative_effect="requires",
             text="Rule text",
@@ -135,8 +135,7 @@ class TestFieldValidation:
                 # Missing required fields
             )
 
-        errors = exc_info.value.errors()
-        assert len(errors) > 0
+        assert exc_info.value.error_count() > 0
 
 
 class TestProvenanceFields: